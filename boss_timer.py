@@ -1,27 +1,45 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-import os, json, asyncio, tempfile
+import os, io, re, sys, json, time, heapq, signal, asyncio, hashlib
 from datetime import datetime, timezone
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue, atexit
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 # ----------------------------
 # Logging Setup
 # ----------------------------
 def setup_logging():
     log_file = f"bot_{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.log"
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=5),  # 5MB per file, keep 5 backups
-            logging.StreamHandler()  # Also log to console
-        ]
-    )
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    handlers = [
+        RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=5),  # 5MB per file, keep 5 backups
+        logging.StreamHandler()  # Also log to console
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    # The event loop only enqueues records; file/console writes and rotation
+    # happen on the listener's thread
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drains the queue on exit
+    queue_handler = QueueHandler(log_queue)
+    # Only the message is pre-rendered here; the real handlers add the prefix
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
     logger = logging.getLogger("BossTimerBot")
-    logger.info(f"Logging initialized to {log_file}")
+    logger.info("Logging initialized to %s", log_file)
     return logger
 
 logger = setup_logging()
@@ -35,6 +53,7 @@ TOKEN = os.getenv("DISCORD_TOKEN")
 BOSSES_FILE = "bosses.json"            # master defaults (global)
 CHANNEL_DATA_FILE = "channel_data.json"  # per-channel bosses + timers
 DASHBOARDS_FILE = "dashboards.json"    # {channel_id: message_id}
+LOGO_FILE = "logo.png"                 # optional dashboard thumbnail
 
 # ----------------------------
 # File Permissions Setup
@@ -46,56 +65,159 @@ def set_file_permissions():
             # Set permissions to 644 (rw-r--r--)
             if os.path.exists(file):
                 os.chmod(file, 0o644)
-                logger.info(f"Set permissions to 644 for {file}")
+                logger.info("Set permissions to 644 for %s", file)
             else:
-                logger.info(f"File {file} does not exist yet, will be created with default permissions")
+                logger.info("File %s does not exist yet, will be created with default permissions", file)
         except Exception as e:
-            logger.error(f"Failed to set permissions for {file}: {e}")
+            logger.error("Failed to set permissions for %s: %s", file, e)
 
 # ----------------------------
 # Async JSON I/O with locks
 # ----------------------------
-_locks = {}
-def _get_lock(path: str) -> asyncio.Lock:
-    if path not in _locks:
-        _locks[path] = asyncio.Lock()
-    return _locks[path]
+# One lock per file path, created on first use (i.e. inside the running loop)
+_locks = defaultdict(asyncio.Lock)
+# Digest of the bytes last written per path; identical saves skip the write + fsync
+_last_saved_digest = {}
+
+# Blocking file work runs on a dedicated worker thread so the event loop keeps
+# serving interactions and gateway heartbeats during disk I/O. A single worker
+# runs jobs FIFO and keeps slow fsyncs out of the loop's default executor.
+_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json-io")
+
+async def _run_io(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(_io_executor, func, *args)
+
+def _read_json_sync(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _encode_json(data, pretty: bool) -> bytes:
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=4).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+# fdatasync skips the inode metadata flush; not available on every platform
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+def _write_json_sync(path, payload: bytes, durable: bool = True):
+    # Callers hold the per-path lock, so a fixed sibling temp name can't collide
+    tmp_path = path + ".tmp"
+    # Raw fd: no Python file object or userspace buffer for a single write.
+    # O_BINARY (Windows only) stops newline translation of the payload.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        # Ensure new file has 644 permissions regardless of umask; the mode
+        # carries over to path through os.replace
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o644)
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        # Without the sync the rename is still atomic, just not guaranteed to
+        # survive a power loss
+        if durable:
+            _datasync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 async def load_json(path, default):
-    async with _get_lock(path):
+    async with _locks[path]:
         if os.path.exists(path):
-            logger.info(f"Loading JSON file: {path}")
+            logger.debug("Loading JSON file: %s", path)
             try:
-                with open(path, "r") as f:
-                    return json.load(f)
+                return await _run_io(_read_json_sync, path)
             except Exception as e:
-                logger.error(f"Failed to load JSON file {path}: {e}")
+                logger.error("Failed to load JSON file %s: %s", path, e)
                 return default
-        logger.info(f"JSON file {path} not found, using default: {default}")
+        logger.info("JSON file %s not found, using default: %s", path, default)
         return default
 
-async def save_json(path, data):
-    async with _get_lock(path):
-        logger.info(f"Saving JSON file: {path}")
+async def save_json(path, data, pretty=True, durable=True) -> bool:
+    """Returns False if the write failed (already logged)."""
+    async with _locks[path]:
+        logger.debug("Saving JSON file: %s", path)
         try:
-            with tempfile.NamedTemporaryFile("w", delete=False, dir=os.path.dirname(path) or ".") as tmp:
-                json.dump(data, tmp, indent=4)
-                tmp.flush()
-                os.fsync(tmp.fileno())
-            os.replace(tmp.name, path)
-            # Ensure new file has 644 permissions
-            os.chmod(path, 0o644)
-            logger.info(f"Successfully saved JSON file: {path}")
+            # Serialize on the loop so the thread writes a consistent snapshot
+            # while handlers keep mutating the live dicts
+            payload = _encode_json(data, pretty)
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if _last_saved_digest.get(path) == digest:
+                logger.debug("JSON file %s unchanged, skipping write", path)
+                return True
+            await _run_io(_write_json_sync, path, payload, durable)
+            _last_saved_digest[path] = digest
+            logger.debug("Successfully saved JSON file: %s", path)
+            return True
         except Exception as e:
-            logger.error(f"Failed to save JSON file {path}: {e}")
+            logger.error("Failed to save JSON file %s: %s", path, e)
+            return False
+
+# ----------------------------
+# Deferred writes
+# ----------------------------
+# Hot paths (every click/command) mark a file dirty instead of rewriting it.
+# The first mark schedules a flush SAVE_DELAY later, so a burst of clicks
+# collapses into one write per file; main() does a final flush on shutdown.
+SAVE_DELAY = 0.25  # seconds
+_pending_writes = {}  # {path: (data, mark number)}; an entry stays until its write succeeds
+_mark_count = 0
+_flush_task = None
+
+def mark_dirty(path, data):
+    global _flush_task, _mark_count
+    _mark_count += 1
+    _pending_writes[path] = (data, _mark_count)
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_after_delay())
+
+async def _flush_after_delay():
+    await asyncio.sleep(SAVE_DELAY)
+    await flush_pending_writes()
+
+async def flush_pending_writes():
+    # Entries are dropped only after their write succeeds, so a flush that is
+    # cancelled (e.g. by asyncio.run on ^C) or fails leaves them for the next one
+    failed = set()
+    while True:
+        todo = [path for path in _pending_writes if path not in failed]
+        if not todo:
+            return
+        for path in todo:
+            entry = _pending_writes.get(path)
+            if entry is None:
+                continue  # written by a concurrent flush
+            data, mark = entry
+            # Only bosses.json is meant for hand-editing; the bot-owned files are written compact.
+            # dashboards.json can be rebuilt with /setdashboard, so it skips the fsync.
+            if not await save_json(path, data, pretty=path == BOSSES_FILE, durable=path != DASHBOARDS_FILE):
+                failed.add(path)  # retried by the next flush
+            elif _pending_writes.get(path, (None, None))[1] == mark:
+                del _pending_writes[path]
+            # else: marked again while writing; the next pass writes the newer state
+
+_logo_bytes = None  # contents of LOGO_FILE, read once in load_initial_data
 
 # Initial async load at startup
 async def load_initial_data():
-    global bosses_master, channel_data, dashboards
+    global bosses_master, channel_data, dashboards, _logo_bytes
     logger.info("Loading initial data")
     bosses_master = await load_json(BOSSES_FILE, [])
     channel_data = await load_json(CHANNEL_DATA_FILE, {})
+    _repair_master_bosses()
+    _repair_channel_records()
+    _intern_boss_names()
+    _master_index.update(_build_index(bosses_master))
     dashboards = await load_json(DASHBOARDS_FILE, {})
+    # Read the logo once; /setdashboard attaches it from memory
+    if os.path.exists(LOGO_FILE):
+        with open(LOGO_FILE, "rb") as f:
+            _logo_bytes = f.read()
+        logger.info("Loaded dashboard logo from %s", LOGO_FILE)
     logger.info("Initial data loaded successfully")
 
 # ----------------------------
@@ -108,92 +230,213 @@ bot = commands.Bot(command_prefix="!", intents=intents)
 # ----------------------------
 # Helpers
 # ----------------------------
+# Lowercased-name indexes over bosses_master and each channel's boss list.
+# The lists stay the source of truth on disk; these are kept in sync by the
+# add/remove helpers below so lookups don't have to scan.
+_master_index = {}
+_channel_index = {}
+
+def _valid_bosses(bosses: list, where: str) -> list:
+    # Interning and indexing need a str "name" on every entry; drop the rest
+    valid = [b for b in bosses if isinstance(b, dict) and isinstance(b.get("name"), str)]
+    if len(valid) != len(bosses):
+        logger.warning("Dropping %s malformed boss entries from %s", len(bosses) - len(valid), where)
+    return valid
+
+def _repair_master_bosses():
+    global bosses_master
+    if not isinstance(bosses_master, list):
+        logger.warning("Ignoring malformed %s: expected a list, got %s", BOSSES_FILE, type(bosses_master).__name__)
+        bosses_master = []
+    bosses_master = _valid_bosses(bosses_master, BOSSES_FILE)
+
+def _repair_channel_records():
+    # Hand-edited or older channel_data.json files can hold records of the
+    # wrong shape. Fix them once here so everything after load (index,
+    # interning, expiry watcher, handlers) can rely on {"bosses": [...], "timers": {...}}.
+    global channel_data
+    if not isinstance(channel_data, dict):
+        logger.warning("Ignoring malformed %s: expected an object, got %s", CHANNEL_DATA_FILE, type(channel_data).__name__)
+        channel_data = {}
+    for cid, rec in list(channel_data.items()):
+        if not isinstance(rec, dict):
+            logger.warning("Dropping malformed record for channel %s: expected an object, got %s", cid, type(rec).__name__)
+            del channel_data[cid]
+            continue
+        if not isinstance(rec.get("bosses"), list):
+            if "bosses" in rec:
+                logger.warning("Resetting malformed boss list for channel %s", cid)
+            rec["bosses"] = []
+        else:
+            rec["bosses"] = _valid_bosses(rec["bosses"], f"channel {cid}")
+        if not isinstance(rec.get("timers"), dict):
+            if "timers" in rec:
+                logger.warning("Resetting malformed timers for channel %s", cid)
+            rec["timers"] = {}
+
+def _intern_boss_names():
+    # The same boss name recurs in bosses_master, every channel's boss list
+    # and its timer keys; the JSON decoder hands back a fresh str for each.
+    # Interning shares one object and makes key comparisons identity hits.
+    for b in bosses_master:
+        b["name"] = sys.intern(b["name"])
+    for rec in channel_data.values():
+        for b in rec["bosses"]:
+            b["name"] = sys.intern(b["name"])
+        rec["timers"] = {sys.intern(name): ts for name, ts in rec["timers"].items()}
+
+def _build_index(bosses):
+    index = {}
+    for b in bosses:
+        index.setdefault(b["name"].lower(), b)
+    return index
+
 def find_master_boss(name: str):
-    return next((b for b in bosses_master if b["name"].lower() == name.lower()), None)
+    return _master_index.get(name.lower())
 
-def fmt_hms(seconds: float) -> str:
-    neg = seconds < 0
-    seconds = abs(int(seconds))
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
-    return f"{'-' if neg else ''}{h:02}:{m:02}:{s:02}"
+def find_channel_boss(cid: str, name: str):
+    ensure_channel_record(cid)
+    return _channel_index[cid].get(name.lower())
+
+def add_master_boss(name: str, respawn: int):
+    boss = {"name": sys.intern(name), "respawn": respawn}
+    bosses_master.append(boss)
+    _master_index[name.lower()] = boss
+    return boss
+
+def add_channel_boss(cid: str, name: str, respawn: int):
+    rec = ensure_channel_record(cid)
+    boss = {"name": sys.intern(name), "respawn": respawn}
+    rec["bosses"].append(boss)
+    _channel_index[cid][name.lower()] = boss
+    return boss
+
+def remove_channel_boss(cid: str, name: str):
+    """Remove a boss (and its timer) from a channel. Returns the removed record, or None."""
+    rec = ensure_channel_record(cid)
+    name_lower = name.lower()
+    boss = _channel_index[cid].pop(name_lower, None)
+    if boss is None:
+        return None
+    rec["bosses"] = [b for b in rec["bosses"] if b["name"].lower() != name_lower]
+    rec["timers"].pop(boss["name"], None)
+    return boss
 
 def now_ts() -> int:
-    return int(datetime.now(timezone.utc).timestamp())
+    return int(time.time())
 
 def ensure_channel_record(cid: str):
-    if cid not in channel_data:
-        channel_data[cid] = {"bosses": [], "timers": {}}
-        logger.info(f"Created new channel record for channel ID: {cid}")
-    if "bosses" not in channel_data[cid]:
-        channel_data[cid]["bosses"] = []
-    if "timers" not in channel_data[cid]:
-        channel_data[cid]["timers"] = {}
+    rec = channel_data.get(cid)
+    if rec is None:
+        rec = channel_data[cid] = {"bosses": [], "timers": {}}
+        logger.info("Created new channel record for channel ID: %s", cid)
+    if cid not in _channel_index:
+        # Records are shape-checked once in load_initial_data, so first touch only builds the index
+        _channel_index[cid] = _build_index(rec["bosses"])
+    return rec
 
 def get_channel_bosses(cid: str):
-    ensure_channel_record(cid)
-    return channel_data[cid]["bosses"]
+    return ensure_channel_record(cid)["bosses"]
 
 def get_channel_timers(cid: str):
-    ensure_channel_record(cid)
-    return channel_data[cid]["timers"]
+    return ensure_channel_record(cid)["timers"]
+
+_TIME_UNITS = {'h': 3600, 'm': 60, 's': 1}
+_TIME_TOKEN_RE = re.compile(r"(\d+)([hms])")
 
+@lru_cache(maxsize=256)  # pure function; only successful parses are cached, errors re-raise each call
 def parse_time(text: str) -> int:
     """Parse time input like '1h', '30m', '45s', or combinations like '1h30m'. Returns seconds."""
     text = text.strip().lower()
-    total_seconds = 0
-    current_number = ""
-    valid_units = {'h': 3600, 'm': 60, 's': 1}
-    
-    for char in text:
-        if char.isdigit():
-            current_number += char
-        elif char in valid_units:
-            if not current_number:
-                raise ValueError("Time format must include a number before the unit (h, m, s)")
-            total_seconds += int(current_number) * valid_units[char]
-            current_number = ""
-        else:
+    leftover = _TIME_TOKEN_RE.sub("", text)
+    if leftover:
+        if any(c not in "0123456789hms" for c in leftover):
             raise ValueError("Invalid time format. Use formats like '1h', '30m', '45s', or '1h30m'")
-    
-    if current_number:
+        if any(c in _TIME_UNITS for c in leftover):
+            raise ValueError("Time format must include a number before the unit (h, m, s)")
         raise ValueError("Incomplete time format. Specify units (h, m, s)")
-    
+
+    total_seconds = sum(int(num) * _TIME_UNITS[unit] for num, unit in _TIME_TOKEN_RE.findall(text))
     if total_seconds <= 0:
         raise ValueError("Time must be positive")
-    
+
     return total_seconds
 
 async def reset_boss_timer(cid: str, boss_name: str):
-    ensure_channel_record(cid)
-    local = next((b for b in channel_data[cid]["bosses"]
-                  if b["name"].lower() == boss_name.lower()), None)
-    base = local or find_master_boss(boss_name)
+    base = find_channel_boss(cid, boss_name) or find_master_boss(boss_name)
     if not base:
-        logger.warning(f"Boss {boss_name} not found for channel {cid}")
+        logger.warning("Boss %s not found for channel %s", boss_name, cid)
         return False
-    channel_data[cid]["timers"][base["name"]] = now_ts() + int(base["respawn"])
-    await save_json(CHANNEL_DATA_FILE, channel_data)
-    logger.info(f"Reset timer for boss {boss_name} in channel {cid}")
+    expiry = now_ts() + int(base["respawn"])
+    get_channel_timers(cid)[base["name"]] = expiry
+    schedule_timer_events(cid, expiry)
+    mark_dirty(CHANNEL_DATA_FILE, channel_data)
+    logger.info("Reset timer for boss %s in channel %s", boss_name, cid)
     return True
 
 async def set_boss_remaining(cid: str, boss_name: str, remaining_seconds: int):
-    ensure_channel_record(cid)
-    channel_data[cid]["timers"][boss_name] = now_ts() + int(remaining_seconds)
-    await save_json(CHANNEL_DATA_FILE, channel_data)
-    logger.info(f"Set remaining time for boss {boss_name} to {remaining_seconds}s in channel {cid}")
+    expiry = now_ts() + int(remaining_seconds)
+    get_channel_timers(cid)[boss_name] = expiry
+    schedule_timer_events(cid, expiry)
+    mark_dirty(CHANNEL_DATA_FILE, channel_data)
+    logger.info("Set remaining time for boss %s to %ss in channel %s", boss_name, remaining_seconds, cid)
+
+DASHBOARD_REFRESH_CONCURRENCY = 8  # keep bursts well under Discord's rate limits
 
 async def refresh_all_dashboards():
-    logger.info("Refreshing all dashboards")
-    for channel_id in list(dashboards.keys()):
-        try:
-            await update_dashboard_message(channel_id)
-        except Exception as e:
-            logger.error(f"Failed to update dashboard for channel {channel_id}: {e}")
-    logger.info("Finished refreshing all dashboards")
+    logger.debug("Refreshing all dashboards")
+    semaphore = asyncio.Semaphore(DASHBOARD_REFRESH_CONCURRENCY)
+
+    async def refresh(channel_id):
+        async with semaphore:
+            try:
+                await update_dashboard_message(channel_id)
+            except Exception as e:
+                logger.error("Failed to update dashboard for channel %s: %s", channel_id, e)
+
+    # gather consumes the generator before any refresh runs, so removals
+    # during the batch can't disturb the iteration; no snapshot copy needed
+    await asyncio.gather(*(refresh(cid) for cid in dashboards))
+    logger.debug("Finished refreshing all dashboards")
+
+DASHBOARD_UPDATE_DELAY = 0.2  # seconds to coalesce back-to-back mutations into one edit
+_pending_dashboard_updates = {}  # {channel_id: (asyncio.TimerHandle, force)}
+_dashboard_update_tasks = set()  # strong refs so running edits aren't garbage-collected
+
+def schedule_dashboard_update(channel_id: str, force: bool = False):
+    """Debounced per-channel refresh: a burst of interactions becomes a single edit.
+
+    force=True edits even if the text is unchanged, which resets the dropdowns
+    on the message; a coalesced burst is forced if any of its calls was.
+    """
+    pending = _pending_dashboard_updates.pop(channel_id, None)
+    if pending is not None:
+        handle, was_forced = pending
+        handle.cancel()
+        force = force or was_forced
+    loop = asyncio.get_running_loop()
+    handle = loop.call_later(DASHBOARD_UPDATE_DELAY, _start_dashboard_update, channel_id, force)
+    _pending_dashboard_updates[channel_id] = (handle, force)
+
+def _start_dashboard_update(channel_id: str, force: bool):
+    _pending_dashboard_updates.pop(channel_id, None)
+    task = asyncio.create_task(_run_dashboard_update(channel_id, force))
+    _dashboard_update_tasks.add(task)
+    task.add_done_callback(_dashboard_update_tasks.discard)
+
+async def _run_dashboard_update(channel_id: str, force: bool):
+    try:
+        await update_dashboard_message(channel_id, force=force)
+    except Exception as e:
+        logger.error("Failed to update dashboard for channel %s: %s", channel_id, e)
 
 
+def remove_dashboard(channel_id: str):
+    dashboards.pop(channel_id, None)
+    _last_render_hash.pop(channel_id, None)
+    invalidate_dashboard_view(channel_id)
+    mark_dirty(DASHBOARDS_FILE, dashboards)
+
 # ----------------------------
 # Event Listeners
 # ----------------------------
@@ -201,12 +444,13 @@ async def refresh_all_dashboards():
 # Register a listener for message deletion events
 @bot.event
 async def on_message_delete(message):
-    # Check if the deleted message is a dashboard message
-    for channel_id, dash_msg_id in list(dashboards.items()):
-        if str(dash_msg_id) == str(message.id):
-            dashboards.pop(channel_id, None)
-            await save_json(DASHBOARDS_FILE, dashboards)
-            logger.info(f"Dashboard message {message.id} deleted in channel {channel_id}. Dashboard reference removed.")
+    # Check if the deleted message is a dashboard message. Dashboards are keyed by
+    # channel, so this is a single lookup rather than a scan on every deletion.
+    channel_id = str(message.channel.id)
+    dash_msg_id = dashboards.get(channel_id)
+    if dash_msg_id is not None and str(dash_msg_id) == str(message.id):
+        remove_dashboard(channel_id)
+        logger.info("Dashboard message %s deleted in channel %s. Dashboard reference removed.", message.id, channel_id)
 
 # ----------------------------
 # UI Components
@@ -224,17 +468,18 @@ class EditTimeModal(discord.ui.Modal):
         self.add_item(self.time_input)
 
     async def on_submit(self, interaction: discord.Interaction):
-        logger.info(f"EditTimeModal submitted for boss {self.boss_name} in channel {self.cid}")
+        logger.info("EditTimeModal submitted for boss %s in channel %s", self.boss_name, self.cid)
         try:
             secs = parse_time(self.time_input.value)
         except Exception as e:
-            logger.error(f"Invalid time input '{self.time_input.value}' for boss {self.boss_name}: {e}")
+            logger.error("Invalid time input '%s' for boss %s: %s", self.time_input.value, self.boss_name, e)
+            schedule_dashboard_update(self.cid, force=True)
             await interaction.response.send_message(f"❌ {e}", ephemeral=True, delete_after=10)
             return
         await set_boss_remaining(self.cid, self.boss_name, secs)
-        await update_dashboard_message(self.cid)
+        schedule_dashboard_update(self.cid, force=True)
         await interaction.response.send_message(f"⏱ Set **{self.boss_name}** to `{self.time_input.value}` remaining.", ephemeral=True, delete_after=10)
-        logger.info(f"Successfully updated time for boss {self.boss_name} to {self.time_input.value}")
+        logger.info("Successfully updated time for boss %s to %s", self.boss_name, self.time_input.value)
 
 class BossDropdown(discord.ui.Select):
     def __init__(self, cid: str, boss_name: str):
@@ -252,15 +497,18 @@ class BossDropdown(discord.ui.Select):
 
     async def callback(self, interaction: discord.Interaction):
         choice = self.values[0]
-        logger.info(f"BossDropdown action: {choice} for boss {self.boss_name} in channel {self.cid}")
+        logger.info("BossDropdown action: %s for boss %s in channel %s", choice, self.boss_name, self.cid)
         if choice == "Killed":
             ok = await reset_boss_timer(self.cid, self.boss_name)
-            await update_dashboard_message(self.cid)
+            # Forced: a repeat kill in the same second or a missing boss renders the same text
+            schedule_dashboard_update(self.cid, force=True)
             msg = "timer reset." if ok else "boss not found."
             await interaction.response.send_message(f"✅ **{self.boss_name}** {msg}", ephemeral=True, delete_after=10)
-            logger.info(f"Killed action result: {msg} for boss {self.boss_name}")
+            logger.info("Killed action result: %s for boss %s", msg, self.boss_name)
         elif choice == "Edit Time":
             await interaction.response.send_modal(EditTimeModal(self.cid, self.boss_name))
+            # A dismissed modal sends nothing back, so reset the select now
+            schedule_dashboard_update(self.cid, force=True)
 
 class AddBossModal(discord.ui.Modal, title="Add New Boss"):
     def __init__(self, cid: str):
@@ -277,28 +525,27 @@ class AddBossModal(discord.ui.Modal, title="Add New Boss"):
 
     async def on_submit(self, interaction: discord.Interaction):
         name = self.boss_name.value.strip()
-        logger.info(f"AddBossModal submitted: {name} with respawn {self.respawn.value} in channel {self.cid}")
+        logger.info("AddBossModal submitted: %s with respawn %s in channel %s", name, self.respawn.value, self.cid)
         try:
             respawn_seconds = parse_time(self.respawn.value.strip())
         except ValueError as e:
-            logger.error(f"Invalid respawn time '{self.respawn.value}' for boss {name}: {e}")
+            logger.error("Invalid respawn time '%s' for boss %s: %s", self.respawn.value, name, e)
             await interaction.response.send_message(f"❌ {e}", ephemeral=True, delete_after=10)
             return
 
         if not find_master_boss(name):
-            bosses_master.append({"name": name, "respawn": respawn_seconds})
-            await save_json(BOSSES_FILE, bosses_master)
-            logger.info(f"Added {name} to master boss list with respawn {respawn_seconds}s")
-
-        ensure_channel_record(self.cid)
-        if not any(b["name"].lower() == name.lower() for b in channel_data[self.cid]["bosses"]):
-            channel_data[self.cid]["bosses"].append({"name": name, "respawn": respawn_seconds})
-            await save_json(CHANNEL_DATA_FILE, channel_data)
-            logger.info(f"Added boss {name} to channel {self.cid}")
+            add_master_boss(name, respawn_seconds)
+            mark_dirty(BOSSES_FILE, bosses_master)
+            logger.info("Added %s to master boss list with respawn %ss", name, respawn_seconds)
+
+        if not find_channel_boss(self.cid, name):
+            add_channel_boss(self.cid, name, respawn_seconds)
+            mark_dirty(CHANNEL_DATA_FILE, channel_data)
+            logger.info("Added boss %s to channel %s", name, self.cid)
             # Set timer for new boss so countdown starts immediately
             await set_boss_remaining(self.cid, name, respawn_seconds)
 
-        await update_dashboard_message(self.cid)
+        schedule_dashboard_update(self.cid, force=True)
         await interaction.response.send_message(f"✅ Boss '{name}' added ({self.respawn.value}).", ephemeral=True, delete_after=10)
 
 class AddBossButton(discord.ui.Button):
@@ -306,7 +553,7 @@ class AddBossButton(discord.ui.Button):
         super().__init__(label="➕ Add Boss", style=discord.ButtonStyle.green)
         self.cid = cid
     async def callback(self, interaction: discord.Interaction):
-        logger.info(f"AddBossButton clicked in channel {self.cid}")
+        logger.info("AddBossButton clicked in channel %s", self.cid)
         await interaction.response.send_modal(AddBossModal(self.cid))
 
 class RemoveBossDropdown(discord.ui.Select):
@@ -319,25 +566,23 @@ class RemoveBossDropdown(discord.ui.Select):
 
     async def callback(self, interaction: discord.Interaction):
         choice = self.values[0]
-        logger.info(f"RemoveBossDropdown action: Removing {choice} from channel {self.cid}")
+        logger.info("RemoveBossDropdown action: Removing %s from channel %s", choice, self.cid)
         if choice == "(No bosses)":
             await interaction.response.send_message("No bosses to remove.", ephemeral=True, delete_after=10)
             logger.info("No bosses available to remove")
             return
-        ensure_channel_record(self.cid)
-        channel_data[self.cid]["bosses"] = [b for b in channel_data[self.cid]["bosses"] if b["name"] != choice]
-        channel_data[self.cid]["timers"].pop(choice, None)
-        await save_json(CHANNEL_DATA_FILE, channel_data)
-        await update_dashboard_message(self.cid)
+        remove_channel_boss(self.cid, choice)
+        mark_dirty(CHANNEL_DATA_FILE, channel_data)
+        schedule_dashboard_update(self.cid)
         await interaction.response.send_message(f"🗑 Removed '{choice}' from this channel.", ephemeral=True, delete_after=10)
-        logger.info(f"Removed boss {choice} from channel {self.cid}")
+        logger.info("Removed boss %s from channel %s", choice, self.cid)
 
 class RemoveBossButton(discord.ui.Button):
     def __init__(self, cid: str):
         super().__init__(label="🗑 Remove Boss", style=discord.ButtonStyle.danger)
         self.cid = cid
     async def callback(self, interaction: discord.Interaction):
-        logger.info(f"RemoveBossButton clicked in channel {self.cid}")
+        logger.info("RemoveBossButton clicked in channel %s", self.cid)
         view = discord.ui.View(timeout=60)
         view.add_item(RemoveBossDropdown(self.cid))
         await interaction.response.send_message("Choose a boss to remove:", view=view, ephemeral=True, delete_after=30)
@@ -355,68 +600,53 @@ class DashboardView(discord.ui.View):
         self.add_item(RemoveBossButton(cid))
         # Log component count for debugging
         component_count = len(self.children)
-        logger.info(f"DashboardView for channel {cid}: {component_count} components ({len(bosses[:max_dropdowns])} bosses, 2 buttons)")
+        logger.info("DashboardView for channel %s: %s components (%s bosses, 2 buttons)", cid, component_count, len(bosses[:max_dropdowns]))
         if len(bosses) > max_dropdowns:
-            logger.warning(f"Channel {cid} has {len(bosses)} bosses, but only {max_dropdowns} included in DashboardView due to 25-component limit")
+            logger.warning("Channel %s has %s bosses, but only %s included in DashboardView due to 25-component limit", cid, len(bosses), max_dropdowns)
+
+# Views are only rebuilt when a channel's boss list changes; timer refreshes reuse them.
+# Keying on the boss names means any roster change (command, button or a
+# manual channel_data edit) is picked up without every path invalidating.
+_view_cache = {}  # {channel_id: (boss names, DashboardView)}
+
+def get_dashboard_view(cid: str) -> DashboardView:
+    signature = tuple(b["name"] for b in get_channel_bosses(cid))
+    cached = _view_cache.get(cid)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    view = DashboardView(cid)
+    _view_cache[cid] = (signature, view)
+    return view
+
+def invalidate_dashboard_view(cid: str):
+    _view_cache.pop(cid, None)
 
 # ----------------------------
 # Dashboard render/update
 # ----------------------------
-async def update_dashboard_message(channel_id: str):
-    if channel_id not in dashboards:
-        logger.warning(f"No dashboard found for channel {channel_id}")
-        return
-    channel = bot.get_channel(int(channel_id))
-    if not channel:
-        logger.warning(f"Channel {channel_id} not found, removing dashboard")
-        dashboards.pop(channel_id, None)
-        await save_json(DASHBOARDS_FILE, dashboards)
-        return
-    try:
-        msg = await channel.fetch_message(int(dashboards[channel_id]))
-    except discord.NotFound:
-        logger.warning(f"Dashboard message {dashboards[channel_id]} not found in channel {channel_id}, removing")
-        dashboards.pop(channel_id, None)
-        await save_json(DASHBOARDS_FILE, dashboards)
-        return
-    except discord.Forbidden:
-        logger.error(f"Bot lacks permission to fetch message {dashboards[channel_id]} in channel {channel_id}")
-        return
-    except discord.HTTPException as e:
-        logger.error(f"HTTP error fetching message {dashboards[channel_id]} in channel {channel_id}: {e}")
-        return
+_last_render_hash = {}  # {channel_id: _render_hash of the embed last pushed to Discord}
+
+def _render_hash(embed: discord.Embed) -> int:
+    return hash((embed.description, embed.footer.text))
+
+@lru_cache(maxsize=1024)
+def _ready_line(name: str) -> str:
+    # Most rows are READY most of the time and the text only depends on the name
+    return f"**{name}** — READY"
 
-    ensure_channel_record(channel_id)
+def build_dashboard_embed(channel_id: str, now: int) -> discord.Embed:
     bosses = get_channel_bosses(channel_id)
     timers = get_channel_timers(channel_id)
 
     lines = []
-    # Track which bosses have already received the 60s warning per channel
-    if not hasattr(update_dashboard_message, "warned_bosses"):
-        update_dashboard_message.warned_bosses = {}
-    warned_bosses = update_dashboard_message.warned_bosses.setdefault(channel_id, set())
-
     for b in bosses:
         name = b["name"]
-        if name in timers:
-            remaining = timers[name] - now_ts()
-            hms = fmt_hms(remaining)
-            respawn_ts = int(timers[name])
-            lines.append(f"**{name}** — Respawns <t:{respawn_ts}:R> (`{hms}`)")
-            # Send a warning if timer enters 1-60s window and hasn't been warned yet
-            if 1 <= remaining <= 90 and name not in warned_bosses:
-                try:
-                    await channel.send(f"{name} will be ready in {remaining} seconds", delete_after=25)
-                    logger.info(f"Sent warning for boss {name} in channel {channel_id}")
-                    warned_bosses.add(name)
-                except Exception as e:
-                    logger.error(f"Failed to send 60 second warning for boss {name} in channel {channel_id}: {e}")
-            # Reset warning if timer is above 60s (for next cycle)
-            elif remaining > 60 and name in warned_bosses:
-                warned_bosses.remove(name)
+        ts = timers.get(name)
+        if ts is not None and ts > now:
+            # <t:..:R> counts down client-side, so the line only changes when the timer does
+            lines.append(f"**{name}** — Respawns <t:{int(ts)}:R>")
         else:
-            lines.append(f"**{name}** — READY (`00:00:00`)")
-
+            lines.append(_ready_line(name))
     if not lines:
         lines = ["No bosses yet. Use ➕ **Add Boss** to get started."]
 
@@ -425,33 +655,164 @@ async def update_dashboard_message(channel_id: str):
     if len(bosses) > 23:
         embed.set_footer(text="Some bosses excluded due to component limit. Use /updatetime or /reset for others.")
 
-    files = []
-    logo_path = "logo.png"
-    if os.path.exists(logo_path):
-        embed.set_thumbnail(url="attachment://logo.png")
-        files = [discord.File(logo_path, filename="logo.png")]
-        logger.info(f"Added logo to dashboard for channel {channel_id}")
+    if _logo_bytes is not None:
+        embed.set_thumbnail(url=f"attachment://{LOGO_FILE}")
+    return embed
+
+def dashboard_logo_files():
+    """Logo attachment for a newly sent dashboard. Edits leave the uploaded file in place."""
+    if _logo_bytes is None:
+        return []
+    # discord.File is consumed on send, so wrap the cached bytes fresh each time
+    return [discord.File(io.BytesIO(_logo_bytes), filename=LOGO_FILE)]
 
+# {channel_id: {boss name: expiry ts the warning was sent for}}. Resetting or
+# editing a timer changes its expiry, which re-arms the warning by itself.
+_warned_for = defaultdict(dict)
+
+async def send_respawn_warnings(channel, channel_id: str, now: int):
+    timers = get_channel_timers(channel_id)
+    warned_for = _warned_for[channel_id]
+
+    sends = []  # [(boss name, pending channel.send)]
+    for b in get_channel_bosses(channel_id):
+        name = b["name"]
+        ts = timers.get(name)
+        if ts is None:
+            continue
+        remaining = ts - now
+        # Send a warning if timer enters 1-90s window and this expiry hasn't been warned yet
+        if 1 <= remaining <= 90 and warned_for.get(name) != ts:
+            # Mark before awaiting so an overlapping refresh can't send it twice
+            warned_for[name] = ts
+            sends.append((name, channel.send(f"{name} will be ready in {remaining} seconds", delete_after=25)))
+
+    if not sends:
+        return
+    # Several bosses can come due together; send their warnings concurrently
+    results = await asyncio.gather(*(send for _, send in sends), return_exceptions=True)
+    for (name, _), result in zip(sends, results):
+        if isinstance(result, Exception):
+            warned_for.pop(name, None)  # retry on the next refresh
+            logger.error("Failed to send 60 second warning for boss %s in channel %s: %s", name, channel_id, result)
+        else:
+            logger.info("Sent warning for boss %s in channel %s", name, channel_id)
+
+async def update_dashboard_message(channel_id: str, force: bool = False):
+    if channel_id not in dashboards:
+        logger.warning("No dashboard found for channel %s", channel_id)
+        return
+    channel = bot.get_channel(int(channel_id))
+    if not channel:
+        logger.warning("Channel %s not found, removing dashboard", channel_id)
+        remove_dashboard(channel_id)
+        return
+
+    # Read the clock here, not per batch: a refresh queued behind the semaphore
+    # must not render with a time from before an expiry it already missed
+    now = now_ts()
+    await send_respawn_warnings(channel, channel_id, now)
+    embed = build_dashboard_embed(channel_id, now)
+    # Nothing visible changed since the last successful edit: skip the edit round-trip.
+    # Interactions that leave the text as-is still force one, because a select
+    # keeps showing the picked option until the message is edited, and picking
+    # the same option again doesn't fire a new interaction.
+    render_hash = _render_hash(embed)
+    if not force and _last_render_hash.get(channel_id) == render_hash:
+        return
+
+    # Re-read after the awaits above: a concurrent update may have removed the dashboard
+    msg_id = dashboards.get(channel_id)
+    if msg_id is None:
+        return
+    # Editing only needs the id; a partial message skips the fetch_message round-trip
+    msg = channel.get_partial_message(int(msg_id))
     try:
-        await msg.edit(embed=embed, view=DashboardView(channel_id), attachments=files)
-        logger.info(f"Updated dashboard message for channel {channel_id}")
+        # No attachments=: the logo uploaded with the message keeps backing attachment://
+        await msg.edit(embed=embed, view=get_dashboard_view(channel_id))
+        _last_render_hash[channel_id] = render_hash
+        logger.debug("Updated dashboard message for channel %s", channel_id)
+    except discord.NotFound:
+        logger.warning("Dashboard message %s not found in channel %s, removing", msg_id, channel_id)
+        # Only if /setdashboard hasn't replaced it while the edit was in flight
+        if dashboards.get(channel_id) == msg_id:
+            remove_dashboard(channel_id)
     except discord.Forbidden:
-        logger.error(f"Bot lacks permission to edit message {dashboards[channel_id]} in channel {channel_id}")
+        # Permission loss doesn't heal on its own; retrying every cycle just burns API calls
+        logger.error("Bot lacks permission to edit message %s in channel %s, removing", msg_id, channel_id)
+        if dashboards.get(channel_id) == msg_id:
+            remove_dashboard(channel_id)
     except discord.HTTPException as e:
-        logger.error(f"HTTP error editing dashboard message {dashboards[channel_id]} in channel {channel_id}: {e}")
+        logger.error("HTTP error editing dashboard message %s in channel %s: %s", msg_id, channel_id, e)
     except ValueError as e:
-        logger.error(f"Failed to create DashboardView for channel {channel_id}: {e}")
+        logger.error("Failed to create DashboardView for channel %s: %s", channel_id, e)
         # Fallback: Update without view to prevent task crash
-        await msg.edit(embed=embed, attachments=files)
-        logger.info(f"Fallback: Updated dashboard message for channel {channel_id} without view due to ValueError")
+        await msg.edit(embed=embed)
+        logger.info("Fallback: Updated dashboard message for channel %s without view due to ValueError", channel_id)
     except Exception as e:
-        logger.error(f"Unexpected error updating dashboard for channel {channel_id}: {e}")
+        logger.error("Unexpected error updating dashboard for channel %s: %s", channel_id, e)
 
-@tasks.loop(seconds=60)  # Update every minute
+@tasks.loop(minutes=10)  # Safety net; mutations and the expiry watcher drive normal updates
 async def update_dashboards():
-    logger.info("Starting dashboard update cycle")
+    logger.debug("Starting dashboard update cycle")
     await refresh_all_dashboards()
 
+# ----------------------------
+# Timer expiry scheduling
+# ----------------------------
+# Besides the slow safety-net loop, each timer queues two wake-ups: when it
+# enters the warning window and when it respawns. watch_timer_expiry sleeps until the
+# earliest one and refreshes only the channels that are due, so warnings go
+# out on time and dashboards flip to READY when the boss is up rather than
+# on the next safety-net tick. Entries left over from timers that were reset
+# since just cause one harmless extra refresh.
+WARNING_LEAD = 60  # seconds before respawn that the warning goes out
+
+_expiry_heap = []      # [(due_ts, channel_id)]
+_expiry_wakeup = None  # asyncio.Event, created by the watcher inside the running loop
+_expiry_task = None
+
+def schedule_timer_events(cid: str, expiry_ts: int):
+    heapq.heappush(_expiry_heap, (expiry_ts - WARNING_LEAD, cid))
+    heapq.heappush(_expiry_heap, (expiry_ts, cid))
+    if _expiry_wakeup is not None:
+        _expiry_wakeup.set()
+
+async def watch_timer_expiry():
+    global _expiry_wakeup
+    _expiry_wakeup = asyncio.Event()
+    while True:
+        _expiry_wakeup.clear()
+        now = now_ts()
+        due = set()
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            due.add(heapq.heappop(_expiry_heap)[1])
+        for cid in due:
+            if cid not in dashboards:
+                continue
+            try:
+                await update_dashboard_message(cid)
+            except Exception as e:
+                logger.error("Failed to update dashboard for channel %s on timer expiry: %s", cid, e)
+        delay = max(0, _expiry_heap[0][0] - now_ts()) if _expiry_heap else None
+        try:
+            await asyncio.wait_for(_expiry_wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+def start_expiry_watcher():
+    global _expiry_task
+    if _expiry_task is not None:
+        return
+    now = now_ts()
+    for cid, rec in channel_data.items():
+        for ts in rec["timers"].values():
+            if ts > now:
+                _expiry_heap.append((ts - WARNING_LEAD, cid))
+                _expiry_heap.append((ts, cid))
+    heapq.heapify(_expiry_heap)
+    _expiry_task = asyncio.create_task(watch_timer_expiry())
+
 # ----------------------------
 # Slash Commands
 # ----------------------------
@@ -459,73 +820,49 @@ async def update_dashboards():
 async def on_ready():
     try:
         await bot.tree.sync()
-        logger.info(f"Bot logged in as {bot.user} and command tree synced")
+        logger.info("Bot logged in as %s and command tree synced", bot.user)
     except Exception as e:
-        logger.error(f"Failed to sync command tree: {e}")
-    update_dashboards.start()
+        logger.error("Failed to sync command tree: %s", e)
+    if not update_dashboards.is_running():
+        update_dashboards.start()
+    start_expiry_watcher()
 
 @bot.tree.command(description="Create a boss dashboard in this channel.")
 async def setdashboard(interaction: discord.Interaction):
     channel_id = str(interaction.channel.id)
-    logger.info(f"/setdashboard called in channel {channel_id} by {interaction.user}")
+    logger.info("/setdashboard called in channel %s by %s", channel_id, interaction.user)
     if channel_id in dashboards:
         msg_id = dashboards[channel_id]
         await interaction.response.send_message(
             f"Dashboard already exists: <https://discord.com/channels/{interaction.guild.id}/{channel_id}/{msg_id}>",
             ephemeral=True
         )
-        logger.info(f"Dashboard already exists for channel {channel_id}: {msg_id}")
+        logger.info("Dashboard already exists for channel %s: %s", channel_id, msg_id)
         return
 
-    ensure_channel_record(channel_id)
-    bosses = get_channel_bosses(channel_id)
-    timers = get_channel_timers(channel_id)
-
-    lines = []
-    for b in bosses:
-        name = b["name"]
-        if name in timers:
-            remaining = timers[name] - now_ts()
-            hms = fmt_hms(remaining)
-            respawn_ts = int(timers[name])
-            lines.append(f"**{name}** — Respawns <t:{respawn_ts}:R> (`{hms}`)")
-        else:
-            lines.append(f"**{name}** — READY (`00:00:00`)")
-    if not lines:
-        lines = ["No bosses yet. Use ➕ **Add Boss** to get started."]
-
-    embed = discord.Embed(title="Boss Timers", description="\n".join(lines), color=0x00ff00)
-    # Add warning if bosses are excluded from the view
-    if len(bosses) > 23:
-        embed.set_footer(text="Some bosses excluded due to component limit. Use /updatetime or /reset for others.")
-
-    files = []
-    logo_path = "logo.png"
-    if os.path.exists(logo_path):
-        embed.set_thumbnail(url="attachment://logo.png")
-        files = [discord.File(logo_path, filename="logo.png")]
-        logger.info(f"Added logo to new dashboard for channel {channel_id}")
+    embed = build_dashboard_embed(channel_id, now_ts())
 
     try:
-        msg = await interaction.channel.send(embed=embed, view=DashboardView(channel_id), files=files)
+        msg = await interaction.channel.send(embed=embed, view=get_dashboard_view(channel_id), files=dashboard_logo_files())
         dashboards[channel_id] = str(msg.id)
-        await save_json(DASHBOARDS_FILE, dashboards)
-        logger.info(f"Created dashboard for channel {channel_id}, message ID: {msg.id}")
+        _last_render_hash[channel_id] = _render_hash(embed)
+        mark_dirty(DASHBOARDS_FILE, dashboards)
+        logger.info("Created dashboard for channel %s, message ID: %s", channel_id, msg.id)
     except Exception as e:
-        logger.error(f"Failed to create dashboard for channel {channel_id}: {e}")
+        logger.error("Failed to create dashboard for channel %s: %s", channel_id, e)
         await interaction.response.send_message("❌ Failed to create dashboard.", ephemeral=True, delete_after=10)
         return
 
     if interaction.channel.permissions_for(interaction.guild.me).manage_messages:
         try:
             await msg.pin(reason="Boss Timers Dashboard")
-            logger.info(f"Pinned dashboard message {msg.id} in channel {channel_id}")
+            logger.info("Pinned dashboard message %s in channel %s", msg.id, channel_id)
         except (discord.Forbidden, discord.HTTPException) as e:
             await interaction.channel.send("⚠️ Could not pin the dashboard (missing permissions or pin limit reached).")
-            logger.warning(f"Could not pin dashboard in channel {channel_id}: {e}")
+            logger.warning("Could not pin dashboard in channel %s: %s", channel_id, e)
     else:
         await interaction.channel.send("⚠️ Bot lacks 'Manage Messages' permission to pin the dashboard.")
-        logger.warning(f"Bot lacks permission to pin dashboard in channel {channel_id}")
+        logger.warning("Bot lacks permission to pin dashboard in channel %s", channel_id)
 
     await interaction.response.send_message(f"Dashboard created: {msg.jump_url}", ephemeral=True, delete_after=10)
 
@@ -533,49 +870,51 @@ async def setdashboard(interaction: discord.Interaction):
 @app_commands.describe(name="Exact boss name", time="Time left, e.g., 1h, 30m, or 1h30m")
 async def updatetime(interaction: discord.Interaction, name: str, time: str):
     cid = str(interaction.channel.id)
-    logger.info(f"/updatetime called for boss {name} with time {time} in channel {cid} by {interaction.user}")
-    if not any(b["name"].lower() == name.lower() for b in get_channel_bosses(cid)):
+    logger.info("/updatetime called for boss %s with time %s in channel %s by %s", name, time, cid, interaction.user)
+    boss = find_channel_boss(cid, name)
+    if not boss:
         await interaction.response.send_message("❌ Boss not tracked in this channel.", ephemeral=True, delete_after=10)
-        logger.warning(f"Boss {name} not tracked in channel {cid}")
+        logger.warning("Boss %s not tracked in channel %s", name, cid)
         return
     try:
         secs = parse_time(time)
     except Exception as e:
-        logger.error(f"Invalid time format '{time}' for boss {name} in channel {cid}: {e}")
+        logger.error("Invalid time format '%s' for boss %s in channel %s: %s", time, name, cid, e)
         await interaction.response.send_message(f"❌ {e}", ephemeral=True, delete_after=10)
         return
 
+    # Timers are keyed by the boss's stored name, not whatever casing was typed
+    name = boss["name"]
     await set_boss_remaining(cid, name, secs)
-    await update_dashboard_message(cid)
+    schedule_dashboard_update(cid, force=True)
     await interaction.response.send_message(f"⏱ Set **{name}** to `{time}` remaining.", ephemeral=True, delete_after=10)
-    logger.info(f"Successfully set {name} to {time} remaining in channel {cid}")
+    logger.info("Successfully set %s to %s remaining in channel %s", name, time, cid)
 
 @bot.tree.command(description="Add a boss (admin). Also updates master list if needed.")
 @app_commands.describe(name="Boss name", respawn_time="Default respawn time, e.g., 8h, 30m, or 1h30m")
 @app_commands.checks.has_permissions(administrator=True)
 async def addboss(interaction: discord.Interaction, name: str, respawn_time: str):
     cid = str(interaction.channel.id)
-    logger.info(f"/addboss called for boss {name} with respawn {respawn_time} in channel {cid} by {interaction.user}")
+    logger.info("/addboss called for boss %s with respawn %s in channel %s by %s", name, respawn_time, cid, interaction.user)
 
     try:
         respawn_seconds = parse_time(respawn_time)
     except ValueError as e:
-        logger.error(f"Invalid respawn time '{respawn_time}' for boss {name}: {e}")
+        logger.error("Invalid respawn time '%s' for boss %s: %s", respawn_time, name, e)
         await interaction.response.send_message(f"❌ {e}", ephemeral=True, delete_after=10)
         return
 
     if not find_master_boss(name):
-        bosses_master.append({"name": name, "respawn": respawn_seconds})
-        await save_json(BOSSES_FILE, bosses_master)
-        logger.info(f"Added {name} to master boss list with respawn {respawn_seconds}s")
+        add_master_boss(name, respawn_seconds)
+        mark_dirty(BOSSES_FILE, bosses_master)
+        logger.info("Added %s to master boss list with respawn %ss", name, respawn_seconds)
 
-    ensure_channel_record(cid)
-    if not any(b["name"].lower() == name.lower() for b in channel_data[cid]["bosses"]):
-        channel_data[cid]["bosses"].append({"name": name, "respawn": respawn_seconds})
-        await save_json(CHANNEL_DATA_FILE, channel_data)
-        logger.info(f"Added boss {name} to channel {cid}")
+    if not find_channel_boss(cid, name):
+        add_channel_boss(cid, name, respawn_seconds)
+        mark_dirty(CHANNEL_DATA_FILE, channel_data)
+        logger.info("Added boss %s to channel %s", name, cid)
 
-    await update_dashboard_message(cid)
+    schedule_dashboard_update(cid)
     await interaction.response.send_message(f"✅ Boss '{name}' added ({respawn_time}).", ephemeral=True, delete_after=10)
 
 @bot.tree.command(description="Remove a boss from THIS channel only.")
@@ -583,37 +922,40 @@ async def addboss(interaction: discord.Interaction, name: str, respawn_time: str
 @app_commands.checks.has_permissions(administrator=True)
 async def removeboss(interaction: discord.Interaction, name: str):
     cid = str(interaction.channel.id)
-    logger.info(f"/removeboss called for boss {name} in channel {cid} by {interaction.user}")
-    ensure_channel_record(cid)
-    before = len(channel_data[cid]["bosses"])
-    channel_data[cid]["bosses"] = [b for b in channel_data[cid]["bosses"] if b["name"].lower() != name.lower()]
-    channel_data[cid]["timers"].pop(name, None)
-    await save_json(CHANNEL_DATA_FILE, channel_data)
-    await update_dashboard_message(cid)
-    after = len(channel_data[cid]["bosses"])
-    if before == after:
+    logger.info("/removeboss called for boss %s in channel %s by %s", name, cid, interaction.user)
+    removed = remove_channel_boss(cid, name)
+    mark_dirty(CHANNEL_DATA_FILE, channel_data)
+    schedule_dashboard_update(cid)
+    if removed is None:
         await interaction.response.send_message("❌ Boss not found in this channel.", ephemeral=True, delete_after=10)
-        logger.warning(f"Boss {name} not found in channel {cid}")
+        logger.warning("Boss %s not found in channel %s", name, cid)
     else:
         await interaction.response.send_message(f"🗑 Removed '{name}' from this channel.", ephemeral=True, delete_after=10)
-        logger.info(f"Removed boss {name} from channel {cid}")
+        logger.info("Removed boss %s from channel %s", name, cid)
 
 @bot.tree.command(description="Mark a boss as killed (uses default respawn).")
 @app_commands.describe(name="Exact boss name")
 async def reset(interaction: discord.Interaction, name: str):
     cid = str(interaction.channel.id)
-    logger.info(f"/reset called for boss {name} in channel {cid} by {interaction.user}")
+    logger.info("/reset called for boss %s in channel %s by %s", name, cid, interaction.user)
     ok = await reset_boss_timer(cid, name)
-    await update_dashboard_message(cid)
+    schedule_dashboard_update(cid, force=True)
     await interaction.response.send_message(
         f"{'✅' if ok else '❌'} {name} {'timer reset.' if ok else 'not found.'}",
         ephemeral=True
     )
-    logger.info(f"Reset action for {name} in channel {cid}: {'success' if ok else 'failed'}")
+    logger.info("Reset action for %s in channel %s: %s", name, cid, 'success' if ok else 'failed')
 
 # ----------------------------
 # Run
 # ----------------------------
+_close_task = None  # strong ref so the SIGTERM close isn't garbage-collected mid-way
+
+def _on_sigterm():
+    global _close_task
+    if _close_task is None:
+        _close_task = asyncio.create_task(bot.close())
+
 async def main():
     if not TOKEN:
         logger.error("DISCORD_TOKEN not found in environment variables")
@@ -621,14 +963,33 @@ async def main():
         return
     set_file_permissions()  # Set JSON file permissions before loading
     await load_initial_data()
+    # Containers/panels stop the bot with SIGTERM: close the client so bot.start()
+    # returns normally and the pending-write flush below still runs
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, _on_sigterm)
+    except NotImplementedError:  # not supported on Windows event loops
+        pass
     try:
         await bot.start(TOKEN)
     except discord.LoginFailure:
         logger.error("Invalid Discord token. Please check your DISCORD_TOKEN.")
         print("Error: Invalid Discord token. Please check your DISCORD_TOKEN.")
     except Exception as e:
-        logger.error(f"Error starting bot: {e}")
+        logger.error("Error starting bot: %s", e)
         print(f"Error starting bot: {e}")
+    finally:
+        # Let a delayed flush that is mid-write finish before the final drain.
+        # On ^C (Python 3.9/3.10) asyncio.run cancels both it and main; its
+        # entries are still queued then, so the drain must run regardless.
+        try:
+            if _flush_task is not None and not _flush_task.done():
+                await asyncio.shield(_flush_task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Deferred flush failed during shutdown: %s", e)
+        finally:
+            await flush_pending_writes()
 
 if __name__ == "__main__":
     asyncio.run(main())